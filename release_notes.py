@@ -8,15 +8,21 @@ and bug fixes. It includes an optional editor agent that reviews and refines
 the generated output for clarity, consistency, and alignment with best practices.
 
 Usage:
-    python release_notes.py <owner> <repo> <start_date> <end_date> [--editor|--no-editor]
+    python release_notes.py <owner> <repo> <start_date> <end_date> [<owner> <repo> <start_date> <end_date> ...] [--editor|--no-editor] [--editor-mode {sections,single}] [--no-cache]
 
     Example:
     python release_notes.py facebook react 2024-01-01 2024-01-31
     python release_notes.py facebook react 2024-01-01 2024-01-31 --no-editor
+    python release_notes.py facebook react 2024-01-01 2024-01-31 facebook jest 2024-01-01 2024-01-31
+
+    Multiple repositories (or date ranges) are processed concurrently.
 
 Options:
     --editor      Enable editor review (default)
     --no-editor   Skip editor review for faster generation
+    --editor-mode Review sections concurrently ("sections", default) or the
+                  whole document in one call ("single")
+    --no-cache    Ignore cached AI responses and don't save new ones
 
 Requirements:
     - GITHUB_TOKEN environment variable (create at https://github.com/settings/tokens)
@@ -24,21 +30,37 @@ Requirements:
     - Install dependencies: pip install -r requirements.txt
 """
 
+import argparse
 import asyncio
+import functools
+import hashlib
 import os
+import random
+import re
 import sys
+import time
 from datetime import datetime
-from typing import Literal
+from pathlib import Path
+from typing import Callable, Literal, TypeVar
 
+import httpx
+import orjson
 from dateutil import parser as date_parser
-from pydantic import BaseModel, Field
+from openai import APIConnectionError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
 from pydantic_ai.mcp import MCPServerStreamableHTTP
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.toolsets import AbstractToolset
 
 
 class IssueInfo(BaseModel):
     """Information about a closed issue"""
 
+    model_config = ConfigDict(extra="forbid")
+
     title: str
     number: int
     url: str
@@ -59,6 +81,8 @@ class IssueInfo(BaseModel):
 class ThemeGroup(BaseModel):
     """A theme grouping of related issues"""
 
+    model_config = ConfigDict(extra="forbid")
+
     name: str
     summary: str = Field(
         description="One sentence summarizing the user impact of this theme",
@@ -69,6 +93,8 @@ class ThemeGroup(BaseModel):
 class ReleaseNotes(BaseModel):
     """Structured release notes output"""
 
+    model_config = ConfigDict(extra="forbid")
+
     theme_groups: list[ThemeGroup] = Field(default_factory=list)
     features: list[IssueInfo] = Field(default_factory=list)
     bug_fixes: list[IssueInfo] = Field(default_factory=list)
@@ -77,6 +103,8 @@ class ReleaseNotes(BaseModel):
 class EditorReview(BaseModel):
     """Editor's review and refinement of release notes"""
 
+    model_config = ConfigDict(extra="forbid")
+
     edited_markdown: str = Field(
         description="The improved version of the release notes markdown"
     )
@@ -98,6 +126,54 @@ class EditorReview(BaseModel):
     )
 
 
+# OpenAI model used for both the release notes and editor agents
+MODEL = "gpt-5"
+
+# A single HTTP client is shared by all GitHub REST and OpenAI requests so
+# connections (and TLS handshakes) are reused across calls. The OpenAI SDK
+# adopts the client's timeout, so it matches pydantic-ai's default (long
+# reasoning calls can go minutes without a byte); GitHub requests pass the
+# shorter HTTP_TIMEOUT_SECONDS per request.
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(600, connect=5)
+HTTP_TIMEOUT_SECONDS = 30
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Agent outputs are cached on disk, keyed on the model, system prompt and prompt
+CACHE_DIR = Path.home() / ".cache" / "release-notes"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# GitHub REST API settings for listing closed issues. The search API returns at
+# most 1,000 results per query.
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_PAGE_SIZE = 100
+GITHUB_SEARCH_MAX_RESULTS = 1000
+GITHUB_MAX_CONCURRENCY = 8
+GITHUB_RATE_LIMIT_RETRIES = 3
+GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS = 120
+
+# Shared by every fetch_closed_issues call so the cap holds across repositories
+_GITHUB_SEMAPHORE = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
+
+# Agent runs that stall or fail transiently are retried with exponential backoff
+AGENT_TIMEOUT_SECONDS = 600
+AGENT_RETRY_ATTEMPTS = 4
+AGENT_RETRY_BACKOFF_BASE = 1.5
+
+# In "sections" mode the editor reviews each "## " section in its own
+# concurrent call, with at most this many calls in flight
+EDITOR_MODES = ("sections", "single")
+EDITOR_MAX_CONCURRENCY = 4
+
+# Shared by every review_with_editor call so the cap holds across repositories
+_EDITOR_SEMAPHORE = asyncio.Semaphore(EDITOR_MAX_CONCURRENCY)
+
+# A table of contents line: "- [Name](#anchor): Summary (3 items)"
+_TOC_LINE_RE = re.compile(
+    r"^- \[(?P<name>.+?)\]\((?P<anchor>#[^)]*)\): .*(?P<count> \(\d+ items?\))$"
+)
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
 # System prompt for the agent
 SYSTEM_INSTRUCTIONS = """You are a technical writer creating release notes for software.
 
@@ -119,10 +195,9 @@ Examples:
 - Good: "Fixed authentication errors that prevented users from logging in"
 - Bad: "Resolved OAuth token expiration bug in auth middleware"
 
-When using GitHub tools:
-- Use available MCP tools to search for and retrieve issue information
-- Filter for closed issues within the specified date range
-- Exclude pull requests, focus only on issues
+When working with issues:
+- The closed issues for the date range are provided in the prompt, already filtered and with pull requests excluded
+- Use the GitHub MCP tools only when you need more information about a specific issue
 - Read titles, labels, and full descriptions to infer themes, user benefits, and any screenshot URLs
 - Extract key information including title, labels, body text, and attachments
 """
@@ -183,9 +258,369 @@ Preserve:
 Output the refined markdown that maintains accuracy while significantly improving clarity, consistency, and professional polish.
 """
 
+# User prompts are split into a static prefix and a short dynamic suffix
+# (repository, dates, markdown) appended at the end. Keeping the static text
+# first lets OpenAI's prompt cache match the shared prefix across runs.
+RELEASE_NOTES_PROMPT_PREFIX = """The closed issues for a repository and date range are listed as JSON at the end of this prompt. Pull requests and issues closed outside the date range have already been removed.
+
+For each issue:
+1. Read the title, labels, and full description/body text to understand the change, infer the user benefit, and identify any screenshot or image URLs
+2. Determine if it's a feature or bug fix (for fallback categorization)
+3. Write a user-focused benefit statement that explains what users gain
+4. Capture a short detail summary (1 paragraph max) that references context from the description/body
+5. Collect any screenshot URLs that illustrate the change
+
+After analyzing all issues, infer broader THEMES that group related issues by user-facing outcomes. For each theme provide:
+- A concise name (2-4 words) that users will understand
+- A one-sentence summary emphasizing the impact of that theme
+- All issues that belong to that theme
+
+If no meaningful themes emerge, leave the theme list empty and ensure issues are still included in the appropriate feature or bug fix lists.
+
+Return a ReleaseNotes object containing theme_groups plus feature and bug lists for fallback."""
+
+EDITOR_PROMPT_PREFIX = """Review and refine the release notes at the end of this prompt.
+
+Apply your editorial expertise to improve clarity, ensure consistency, and align with best practices while preserving all factual content.
+
+Provide the refined markdown along with detailed documentation of changes made."""
+
+EDITOR_SECTION_PROMPT_PREFIX = """Review and refine the release notes section at the end of this prompt.
+
+This is one section of a larger document whose other sections are reviewed separately. Keep the section's heading line exactly as it is, because headings are used as link anchors, and don't add content from outside this section.
+
+Apply your editorial expertise to improve clarity, ensure consistency, and align with best practices while preserving all factual content.
+
+Provide the refined markdown for this section along with detailed documentation of changes made."""
+
+
+class _AnchorTable(dict):
+    """str.translate table that keeps alphanumerics, maps spaces and hyphens to
+    "-" and drops everything else. Entries are computed on first use."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        if char.isalnum():
+            value = codepoint
+        elif char in " -":
+            value = ord("-")
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_ANCHOR_TABLE = _AnchorTable()
+
+_DASH_RE = re.compile(r"-+")
+
+
+def anchor_from_theme(name: str) -> str:
+    """Create a GitHub-friendly anchor from a theme name."""
+    anchor = name.strip().lower().translate(_ANCHOR_TABLE)
+    anchor = _DASH_RE.sub("-", anchor).strip("-")
+    return anchor or "theme"
+
+
+def rate_limit_delay(response: httpx.Response) -> float | None:
+    """Return how long to wait before retrying a rate-limited GitHub response.
+
+    Returns None if the response was not rate limited (a 403 can also mean
+    missing permissions).
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    reset = response.headers.get("X-RateLimit-Reset")
+    if response.headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+        return max(float(reset) - time.time(), 0) + 1
+    if response.status_code == 429:
+        return 60.0
+    return None
+
+
+async def fetch_closed_issues(
+    owner: str,
+    repo: str,
+    since: str,
+    until: str,
+    github_token: str,
+    http_client: httpx.AsyncClient,
+) -> list[dict]:
+    """Fetch all issues closed in a date range from the GitHub search API.
+
+    The first page reports the total result count; the remaining pages are then
+    requested concurrently. At most GITHUB_MAX_CONCURRENCY requests are in
+    flight across all calls, and rate-limited requests are retried once the
+    limit resets.
+    """
+    query = f"repo:{owner}/{repo} is:issue is:closed closed:{since}..{until}"
+    # Headers are set per request; the shared client also talks to OpenAI
+    headers = {
+        "Authorization": f"Bearer {github_token}",
+        "Accept": "application/vnd.github+json",
+    }
+
+    async def fetch_page(page: int) -> dict:
+        async with _GITHUB_SEMAPHORE:
+            for attempt in range(GITHUB_RATE_LIMIT_RETRIES + 1):
+                response = await http_client.get(
+                    f"{GITHUB_API_URL}/search/issues",
+                    params={"q": query, "per_page": GITHUB_PAGE_SIZE, "page": page},
+                    headers=headers,
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                )
+                delay = rate_limit_delay(response)
+                if (
+                    delay is None
+                    or attempt == GITHUB_RATE_LIMIT_RETRIES
+                    or delay > GITHUB_MAX_RATE_LIMIT_WAIT_SECONDS
+                ):
+                    break
+                print(f"GitHub rate limit reached, retrying in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+    first_page = await fetch_page(1)
+    if first_page["total_count"] > GITHUB_SEARCH_MAX_RESULTS:
+        print(
+            f"Warning: {owner}/{repo} has {first_page['total_count']} issues closed "
+            f"between {since} and {until}, but GitHub search returns at most "
+            f"{GITHUB_SEARCH_MAX_RESULTS}. Use a shorter date range to include them all."
+        )
+    total = min(first_page["total_count"], GITHUB_SEARCH_MAX_RESULTS)
+    last_page = -(-total // GITHUB_PAGE_SIZE)
+    other_pages = await asyncio.gather(
+        *(fetch_page(page) for page in range(2, last_page + 1))
+    )
+
+    pages = (first_page, *other_pages)
+    if any(page["incomplete_results"] for page in pages):
+        print(
+            f"Warning: GitHub search timed out for {owner}/{repo}; "
+            "some closed issues may be missing"
+        )
+
+    # Keep only the fields the agent needs, to save tokens
+    return [
+        {
+            "number": item["number"],
+            "title": item["title"],
+            "url": item["html_url"],
+            "labels": [label["name"] for label in item["labels"]],
+            "closed_at": item["closed_at"],
+            "body": item["body"] or "",
+        }
+        for page in pages
+        for item in page["items"]
+        if "pull_request" not in item
+    ]
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(http_client: httpx.AsyncClient) -> OpenAIChatModel:
+    """Return the OpenAI model, sending its requests through the shared client."""
+    return OpenAIChatModel(MODEL, provider=OpenAIProvider(http_client=http_client))
+
+
+def github_mcp_server(github_token: str) -> MCPServerStreamableHTTP:
+    """Create a GitHub MCP server (remote hosted version) for a single run.
+
+    Each run needs its own server: its connection must be opened and closed in
+    the same task, so it can't be shared by concurrent runs. It also keeps its
+    own HTTP connection, because pydantic-ai doesn't allow per-server headers
+    on a custom client and the GitHub token must not become a default header
+    on the client shared with OpenAI.
+    """
+    return MCPServerStreamableHTTP(
+        url="https://api.githubcopilot.com/mcp/",
+        headers={
+            "Authorization": f"Bearer {github_token}",
+            "X-MCP-Toolsets": "issues,pull_requests",   # Limit what the agent can access
+            "X-MCP-Readonly": "true"    # Don't allow any editing changes
+        },
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gen_agent(http_client: httpx.AsyncClient) -> Agent:
+    """Return the release notes agent, built once per client.
+
+    Reusing the agent avoids rebuilding its output schema on every call. The
+    GitHub MCP server is passed in per run (see github_mcp_server).
+    """
+    return Agent(
+        model=_get_model(http_client),
+        output_type=ReleaseNotes,
+        system_prompt=SYSTEM_INSTRUCTIONS,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_editor_agent(http_client: httpx.AsyncClient) -> Agent:
+    """Return the editor agent, built once per client."""
+    # No MCP tools needed, just reviewing markdown
+    return Agent(
+        model=_get_model(http_client),
+        output_type=EditorReview,
+        system_prompt=EDITOR_INSTRUCTIONS,
+    )
+
+
+def append_issue(parts: list[str], issue: IssueInfo) -> None:
+    """Append the markdown bullet (and any details/screenshots) for an issue."""
+    parts.append(f"- {issue.user_benefit} ([#{issue.number}]({issue.url}))\n")
+    if issue.detail_summary:
+        parts.append(f"  - {issue.detail_summary}\n")
+    parts.extend(
+        f"  - ![Screenshot {idx}]({url})\n"
+        for idx, url in enumerate(issue.screenshot_urls, start=1)
+    )
+
+
+def rebuild_toc(toc: str, sections: list[str]) -> str:
+    """Refresh the theme summaries in a table of contents from edited sections.
+
+    A theme section is its "## <name>" heading followed by the summary
+    paragraph that the table of contents repeats. Lines whose theme can't be
+    found are kept as they are.
+    """
+    summaries = {}
+    for section in sections:
+        heading, _, body = section.partition("\n")
+        summary = body.strip().split("\n\n", 1)[0]
+        if heading.startswith("## ") and summary and not summary.startswith("- "):
+            summaries[heading[3:].strip()] = " ".join(summary.split())
+
+    lines = []
+    for line in toc.splitlines(keepends=True):
+        match = _TOC_LINE_RE.match(line.rstrip("\n"))
+        if match and match["name"] in summaries:
+            line = (
+                f"- [{match['name']}]({match['anchor']}): "
+                f"{summaries[match['name']]}{match['count']}\n"
+            )
+        lines.append(line)
+    return "".join(lines)
+
+
+def cache_key(system_prompt: str, prompt: str) -> str:
+    """Return a stable hash identifying an agent call."""
+    payload = orjson.dumps(
+        {"model": MODEL, "sys": system_prompt, "prompt": prompt},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def is_retryable(error: Exception) -> bool:
+    """Return True for timeouts, connection failures and 429/5xx model responses."""
+    if isinstance(error, ModelHTTPError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (asyncio.TimeoutError, httpx.HTTPError, APIConnectionError))
+
+
+async def run_with_retry(
+    agent: Agent,
+    prompt: str,
+    *,
+    toolsets: list[AbstractToolset] | None = None,
+    on_partial: Callable[[BaseModel], None] | None = None,
+    on_retry: Callable[[], None] | None = None,
+    attempts: int = AGENT_RETRY_ATTEMPTS,
+    base: float = AGENT_RETRY_BACKOFF_BASE,
+    timeout: float = AGENT_TIMEOUT_SECONDS,
+) -> BaseModel:
+    """Stream an agent run with a timeout, retrying transient failures with jittered backoff.
+
+    Each retry streams the output from the start again, so on_retry (if given)
+    is called first to let callers reset any progress tracked via on_partial.
+    """
+
+    async def run_once() -> BaseModel:
+        async with agent.run_stream(prompt, toolsets=toolsets) as result:
+            if on_partial is not None:
+                async for partial in result.stream_output():
+                    on_partial(partial)
+            return await result.get_output()
+
+    for attempt in range(1, attempts + 1):
+        try:
+            return await asyncio.wait_for(run_once(), timeout)
+        except Exception as e:
+            if attempt == attempts or not is_retryable(e):
+                raise
+            delay = base**attempt + random.uniform(0, 0.5)
+            print(
+                f"Agent run failed ({type(e).__name__}: {e}), "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1} of {attempts})..."
+            )
+            await asyncio.sleep(delay)
+            if on_retry is not None:
+                on_retry()
+
+
+async def cached_run(
+    agent: Agent,
+    prompt: str,
+    output_type: type[OutputT],
+    system_prompt: str,
+    use_cache: bool = True,
+    on_partial: Callable[[OutputT], None] | None = None,
+    on_retry: Callable[[], None] | None = None,
+    toolsets: list[AbstractToolset] | None = None,
+) -> OutputT:
+    """Run the agent, reusing a previous output for an identical call if one is cached.
+
+    The agent output is streamed, and on_partial (if given) is called with each
+    partial output as it arrives so callers can report progress early, and
+    on_retry before a failed run is streamed again. toolsets are added to the
+    agent's own for this run only.
+    """
+    cache_file = CACHE_DIR / f"{cache_key(system_prompt, prompt)}.json"
+
+    if use_cache and cache_file.exists():
+        age = time.time() - cache_file.stat().st_mtime
+        if age < CACHE_TTL_SECONDS:
+            try:
+                output = output_type.model_validate_json(cache_file.read_bytes())
+                print("Using cached AI response")
+                return output
+            except ValidationError:
+                # Stale or corrupt entry; fall through and regenerate it
+                pass
+
+    output = await run_with_retry(
+        agent, prompt, toolsets=toolsets, on_partial=on_partial, on_retry=on_retry
+    )
+
+    if use_cache:
+        # Write to a temporary file and rename it into place so concurrent runs
+        # never read a half-written entry. A failed write only loses the cache
+        # entry, not the result.
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.{id(output)}.tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(output.model_dump_json(), encoding="utf-8")
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: could not save AI response to cache: {e}")
+            temp_file.unlink(missing_ok=True)
+
+    return output
+
 
 async def generate_release_notes(
-    owner: str, repo: str, start_date: datetime, end_date: datetime
+    owner: str,
+    repo: str,
+    start_date: datetime,
+    end_date: datetime,
+    http_client: httpx.AsyncClient,
+    use_cache: bool = True,
 ) -> str:
     """Generate release notes for the given repository and date range using GitHub MCP server."""
 
@@ -207,64 +642,83 @@ async def generate_release_notes(
     if not owner or not repo:
         raise ValueError("Repository owner and name cannot be empty")
 
-    print(f"Connecting to GitHub MCP server...")
-
-    # Configure GitHub MCP server (remote hosted version)
-    github_mcp = MCPServerStreamableHTTP(
-        url="https://api.githubcopilot.com/mcp/",
-        headers={
-            "Authorization": f"Bearer {github_token}",
-            "X-MCP-Toolsets": "issues,pull_requests",   # Limit what the agent can access
-            "X-MCP-Readonly": "true"    # Don't allow any editing changes
-        },
-    )
-
     print(f"Fetching closed issues from {owner}/{repo}...")
     print(f"Date range: {start_date.date()} to {end_date.date()}")
 
-    # Create the agent with GitHub MCP server
-    agent = Agent(
-        model="openai:gpt-5",
-        output_type=ReleaseNotes,
-        system_prompt=SYSTEM_INSTRUCTIONS,
-        toolsets=[github_mcp],
-    )
+    # Filter issues here rather than asking the LLM to, so it only sees the
+    # issues it has to summarize
+    try:
+        issues = await fetch_closed_issues(
+            owner,
+            repo,
+            start_date.date().isoformat(),
+            end_date.date().isoformat(),
+            github_token,
+            http_client,
+        )
+    except httpx.HTTPError as e:
+        raise ValueError(f"Failed to fetch closed issues: {e}")
 
-    # Construct the prompt for the agent
-    prompt = f"""Using the GitHub MCP server tools, retrieve all closed issues from the repository {owner}/{repo} that were closed between {start_date.date()} and {end_date.date()}.
+    if not issues:
+        return f"No closed issues found between {start_date.date()} and {end_date.date()}"
 
-For each closed issue found:
-1. Exclude any pull requests - only include actual issues
-2. Read the title, labels, and full description/body text to understand the change, infer the user benefit, and identify any screenshot or image URLs
-3. Determine if it's a feature or bug fix (for fallback categorization)
-4. Write a user-focused benefit statement that explains what users gain
-5. Capture a short detail summary (1 paragraph max) that references context from the description/body
-6. Collect any screenshot URLs that illustrate the change
+    print(f"Found {len(issues)} closed issues")
+    print(f"Connecting to GitHub MCP server...")
 
-After analyzing all issues, infer broader THEMES that group related issues by user-facing outcomes. For each theme provide:
-- A concise name (2-4 words) that users will understand
-- A one-sentence summary emphasizing the impact of that theme
-- All issues that belong to that theme
+    agent = _get_gen_agent(http_client)
+    github_mcp = github_mcp_server(github_token)
 
-If no meaningful themes emerge, leave the theme list empty and ensure issues are still included in the appropriate feature or bug fix lists.
+    # Construct the prompt for the agent. Dynamic values go last so the static
+    # prefix can be served from the provider's prompt cache across runs.
+    prompt = RELEASE_NOTES_PROMPT_PREFIX + (
+        f"\n\nRepository: {owner}/{repo}"
+        f"\nClosed: {start_date.date()}..{end_date.date()}"
+        f"\n\nIssues (JSON):\n{orjson.dumps(issues).decode()}"
+    )
+
+    print("Generating release notes with AI...")
 
-Search criteria:
-- Repository: {owner}/{repo}
-- State: closed
-- Closed date: between {start_date.isoformat()} and {end_date.isoformat()}
-- Type: issues only (not pull requests)
+    # Report each theme as soon as the agent moves on to the next one
+    announced = 0
 
-Return a ReleaseNotes object containing theme_groups plus feature and bug lists for fallback."""
+    def announce_themes(themes: list[ThemeGroup]) -> None:
+        nonlocal announced
+        for theme in themes[announced:]:
+            if theme.issues:
+                print(f"  [{owner}/{repo}] Drafted theme: {theme.name}")
+        announced = max(announced, len(themes))
 
-    print("Generating release notes with AI...")
+    def restart_announcements() -> None:
+        nonlocal announced
+        announced = 0
 
     try:
-        # Run the agent (MCP server connected via toolsets parameter)
-        result = await agent.run(prompt)
-        release_notes = result.output
+        # Run the agent (this run's MCP server connected via toolsets). The last
+        # theme in a partial output may still be growing, so hold it back.
+        release_notes = await cached_run(
+            agent,
+            prompt,
+            ReleaseNotes,
+            SYSTEM_INSTRUCTIONS,
+            use_cache,
+            on_partial=lambda partial: announce_themes(partial.theme_groups[:-1]),
+            on_retry=restart_announcements,
+            toolsets=[github_mcp],
+        )
     except Exception as e:
         raise ValueError(f"Failed to generate release notes: {e}")
 
+    announce_themes(release_notes.theme_groups)
+
+    # Drop themes the agent left empty so they don't show up as "(0 items)".
+    # The agent output was already validated by pydantic-ai, so rebuild it with
+    # model_construct() rather than paying for validation a second time.
+    release_notes = ReleaseNotes.model_construct(
+        theme_groups=[theme for theme in release_notes.theme_groups if theme.issues],
+        features=release_notes.features,
+        bug_fixes=release_notes.bug_fixes,
+    )
+
     # Check if we got any results
     if (
         not release_notes.theme_groups
@@ -274,112 +728,127 @@ Return a ReleaseNotes object containing theme_groups plus feature and bug lists
         return f"No closed issues found between {start_date.date()} and {end_date.date()}"
 
     # Format as markdown
-    markdown = f"""# Release Notes: {owner}/{repo}
-
-**Period:** {start_date.date()} to {end_date.date()}
-
-"""
-
-    def anchor_from_theme(name: str) -> str:
-        """Create a GitHub-friendly anchor from a theme name."""
-        anchor = name.strip().lower()
-        cleaned = []
-        for char in anchor:
-            if char.isalnum():
-                cleaned.append(char)
-            elif char in {" ", "-"}:
-                cleaned.append("-")
-        anchor = "".join(cleaned)
-        while "--" in anchor:
-            anchor = anchor.replace("--", "-")
-        anchor = anchor.strip("-")
-        return anchor or "theme"
+    parts = [
+        f"# Release Notes: {owner}/{repo}\n\n",
+        f"**Period:** {start_date.date()} to {end_date.date()}\n\n",
+    ]
 
     if release_notes.theme_groups:
-        markdown += "## Themes\n\n"
+        parts.append("## Themes\n\n")
         for theme in release_notes.theme_groups:
             anchor = anchor_from_theme(theme.name)
             count = len(theme.issues)
             label = "item" if count == 1 else "items"
-            markdown += (
+            parts.append(
                 f"- [{theme.name}](#{anchor}): {theme.summary} ({count} {label})\n"
             )
-        markdown += "\n"
+        parts.append("\n")
 
         for theme in release_notes.theme_groups:
-            anchor = anchor_from_theme(theme.name)
-            markdown += f"## {theme.name}\n\n"
-            markdown += f"{theme.summary}\n\n"
+            parts.append(f"## {theme.name}\n\n")
+            parts.append(f"{theme.summary}\n\n")
             for issue in theme.issues:
-                markdown += f"- {issue.user_benefit} ([#{issue.number}]({issue.url}))\n"
-                if issue.detail_summary:
-                    markdown += f"  - {issue.detail_summary}\n"
-                if issue.screenshot_urls:
-                    for idx, url in enumerate(issue.screenshot_urls, start=1):
-                        markdown += f"  - ![Screenshot {idx}]({url})\n"
-            markdown += "\n"
+                append_issue(parts, issue)
+            parts.append("\n")
 
         total_issues = sum(len(theme.issues) for theme in release_notes.theme_groups)
     else:
         if release_notes.features:
-            markdown += "## Features\n\n"
+            parts.append("## Features\n\n")
             for feature in release_notes.features:
-                markdown += (
-                    f"- {feature.user_benefit} ([#{feature.number}]({feature.url}))\n"
-                )
-                if feature.detail_summary:
-                    markdown += f"  - {feature.detail_summary}\n"
-                if feature.screenshot_urls:
-                    for idx, url in enumerate(feature.screenshot_urls, start=1):
-                        markdown += f"  - ![Screenshot {idx}]({url})\n"
-            markdown += "\n"
+                append_issue(parts, feature)
+            parts.append("\n")
 
         if release_notes.bug_fixes:
-            markdown += "## Bug Fixes\n\n"
+            parts.append("## Bug Fixes\n\n")
             for bug in release_notes.bug_fixes:
-                markdown += f"- {bug.user_benefit} ([#{bug.number}]({bug.url}))\n"
-                if bug.detail_summary:
-                    markdown += f"  - {bug.detail_summary}\n"
-                if bug.screenshot_urls:
-                    for idx, url in enumerate(bug.screenshot_urls, start=1):
-                        markdown += f"  - ![Screenshot {idx}]({url})\n"
-            markdown += "\n"
+                append_issue(parts, bug)
+            parts.append("\n")
 
         total_issues = len(release_notes.features) + len(release_notes.bug_fixes)
 
     print(f"Successfully processed {total_issues} issues")
 
-    return markdown
+    return "".join(parts)
 
 
-async def review_with_editor(markdown: str, owner: str, repo: str) -> EditorReview:
-    """Review and refine release notes using an editor agent."""
+async def review_with_editor(
+    markdown: str,
+    owner: str,
+    repo: str,
+    http_client: httpx.AsyncClient,
+    use_cache: bool = True,
+    mode: str = "sections",
+) -> EditorReview:
+    """Review and refine release notes using an editor agent.
 
-    print("Running editor review for quality and consistency...")
+    In "sections" mode each "## " section is reviewed by its own concurrent
+    call and the results are merged; "single" mode reviews the whole document
+    in one call.
+    """
+    editor_agent = _get_editor_agent(http_client)
 
-    # Create the editor agent (no MCP tools needed, just reviewing markdown)
-    editor_agent = Agent(
-        model="openai:gpt-5",
-        output_type=EditorReview,
-        system_prompt=EDITOR_INSTRUCTIONS,
-    )
+    # The title and period before the first section are left as they are
+    header, *sections = re.split(r"(?m)^(?=## )", markdown)
 
-    # Construct the prompt for the editor
-    prompt = f"""Review and refine the following release notes for {owner}/{repo}.
+    # The themes table of contents only repeats theme names and summaries, so
+    # it isn't reviewed on its own; it is rebuilt from the edited sections
+    toc = ""
+    if sections and sections[0].startswith("## Themes\n"):
+        toc, *sections = sections
 
-Apply your editorial expertise to improve clarity, ensure consistency, and align with best practices while preserving all factual content.
+    if mode == "single" or len(sections) < 2:
+        print("Running editor review for quality and consistency...")
+
+        # Construct the prompt for the editor (static framing first, see above)
+        prompt = EDITOR_PROMPT_PREFIX + (
+            f"\n\nRepository: {owner}/{repo}\n\nRelease Notes to Review:\n{markdown}"
+        )
 
-Release Notes to Review:
-{markdown}
+        try:
+            return await cached_run(
+                editor_agent, prompt, EditorReview, EDITOR_INSTRUCTIONS, use_cache
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to complete editor review: {e}")
 
-Provide the refined markdown along with detailed documentation of changes made."""
+    print(
+        f"Running editor review for quality and consistency "
+        f"({len(sections)} sections)..."
+    )
+
+    async def review_section(section: str) -> EditorReview:
+        prompt = EDITOR_SECTION_PROMPT_PREFIX + (
+            f"\n\nRepository: {owner}/{repo}\n\nSection to Review:\n{section}"
+        )
+        async with _EDITOR_SEMAPHORE:
+            return await cached_run(
+                editor_agent, prompt, EditorReview, EDITOR_INSTRUCTIONS, use_cache
+            )
 
     try:
-        result = await editor_agent.run(prompt)
-        return result.output
+        reviews = await asyncio.gather(*(review_section(section) for section in sections))
     except Exception as e:
         raise ValueError(f"Failed to complete editor review: {e}")
 
+    edited_sections = [review.edited_markdown.strip() + "\n\n" for review in reviews]
+
+    # Each review was validated when it was produced, so merge without
+    # validating again
+    return EditorReview.model_construct(
+        edited_markdown=header
+        + rebuild_toc(toc, edited_sections)
+        + "".join(edited_sections),
+        changes_made=[c for review in reviews for c in review.changes_made],
+        clarity_issues_fixed=[
+            c for review in reviews for c in review.clarity_issues_fixed
+        ],
+        consistency_improvements=[
+            c for review in reviews for c in review.consistency_improvements
+        ],
+        recommendations=[c for review in reviews for c in review.recommendations],
+    )
+
 
 def parse_date(date_str: str) -> datetime:
     """Parse a date string into a datetime object."""
@@ -389,105 +858,200 @@ def parse_date(date_str: str) -> datetime:
         raise ValueError(f"Invalid date format '{date_str}': {e}")
 
 
+def write_output(path: str, text: str) -> None:
+    """Write text to a file as UTF-8 in one pass, bypassing text-mode buffering."""
+    # Slice a memoryview on partial writes so the remaining bytes aren't copied
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+_PARSER = argparse.ArgumentParser(
+    description="Generate user-friendly release notes from closed GitHub issues.",
+    usage=(
+        "%(prog)s <owner> <repo> <start_date> <end_date> "
+        "[<owner> <repo> <start_date> <end_date> ...] [--editor|--no-editor] "
+        "[--editor-mode {sections,single}] [--no-cache]"
+    ),
+    epilog="""examples:
+  %(prog)s facebook react 2024-01-01 2024-01-31
+  %(prog)s facebook react 2024-01-01 2024-01-31 --no-editor
+  %(prog)s facebook react 2024-01-01 2024-01-31 facebook jest 2024-01-01 2024-01-31
+
+environment variables required:
+  GITHUB_TOKEN    Your GitHub Personal Access Token
+  OPENAI_API_KEY  Your OpenAI API key""",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+_PARSER.add_argument(
+    "targets",
+    nargs="+",
+    metavar="<owner> <repo> <start_date> <end_date>",
+    help="repository and date range; repeat to process several concurrently",
+)
+_PARSER.add_argument(
+    "--editor",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="run the editor review pass (default: enabled)",
+)
+_PARSER.add_argument(
+    "--editor-mode",
+    choices=EDITOR_MODES,
+    default="sections",
+    help=(
+        "review each section in its own concurrent call, or the whole "
+        "document in one call (default: sections)"
+    ),
+)
+_PARSER.add_argument(
+    "--cache",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="reuse and save cached AI responses (default: enabled)",
+)
+
+
+async def build_release_notes(
+    owner: str,
+    repo: str,
+    start_date: datetime,
+    end_date: datetime,
+    use_editor: bool,
+    use_cache: bool,
+    http_client: httpx.AsyncClient,
+    editor_mode: str = "sections",
+) -> tuple[str, EditorReview | None]:
+    """Generate release notes for one repository and optionally run the editor review."""
+    release_notes = await generate_release_notes(
+        owner, repo, start_date, end_date, http_client, use_cache
+    )
+    if not use_editor:
+        return release_notes, None
+    return release_notes, await review_with_editor(
+        release_notes, owner, repo, http_client, use_cache, editor_mode
+    )
+
+
 async def main():
     """Main entry point for the CLI."""
-    if len(sys.argv) < 5 or len(sys.argv) > 6:
-        print("Usage: python release_notes.py <owner> <repo> <start_date> <end_date> [--editor|--no-editor]")
-        print("\nExample:")
-        print("  python release_notes.py facebook react 2024-01-01 2024-01-31")
-        print("  python release_notes.py facebook react 2024-01-01 2024-01-31 --editor")
-        print("\nOptions:")
-        print("  --editor      Enable editor review (default)")
-        print("  --no-editor   Skip editor review")
-        print("\nEnvironment variables required:")
-        print("  - GITHUB_TOKEN: Your GitHub Personal Access Token")
-        print("  - OPENAI_API_KEY: Your OpenAI API key")
-        sys.exit(1)
+    args = _PARSER.parse_intermixed_args()
+    if len(args.targets) % 4 != 0:
+        _PARSER.error(
+            "expected <owner> <repo> <start_date> <end_date> for each repository"
+        )
 
-    owner = sys.argv[1]
-    repo = sys.argv[2]
-    start_date_str = sys.argv[3]
-    end_date_str = sys.argv[4]
-
-    # Parse editor flag (default to True)
-    use_editor = True
-    if len(sys.argv) == 6:
-        flag = sys.argv[5].lower()
-        if flag == "--no-editor":
-            use_editor = False
-        elif flag == "--editor":
-            use_editor = True
-        else:
-            print(f"Error: Unknown option '{sys.argv[5]}'. Use --editor or --no-editor")
+    # Each group of four positional arguments describes one repository and date range
+    targets = []
+    for i in range(0, len(args.targets), 4):
+        owner, repo, start_date_str, end_date_str = args.targets[i : i + 4]
+
+        try:
+            start_date = parse_date(start_date_str)
+            end_date = parse_date(end_date_str)
+        except ValueError as e:
+            print(f"Error: {e}")
             sys.exit(1)
 
-    try:
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-    except ValueError as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        if start_date > end_date:
+            print(f"Error: Start date must be before end date for {owner}/{repo}")
+            sys.exit(1)
 
-    if start_date > end_date:
-        print("Error: Start date must be before end date")
-        sys.exit(1)
+        targets.append((owner, repo, start_date, end_date))
 
     try:
-        release_notes = await generate_release_notes(owner, repo, start_date, end_date)
-
-        # Run editor review if enabled
-        final_markdown = release_notes
-        if use_editor:
-            editor_review = await review_with_editor(release_notes, owner, repo)
+        # Run every repository concurrently so LLM and MCP latency overlaps.
+        # Runs share the agents and HTTP/2 client; each opens its own MCP
+        # server connection. A failed
+        # run is returned rather than raised so the other runs can finish.
+        async with httpx.AsyncClient(
+            http2=True, timeout=HTTP_CLIENT_TIMEOUT, limits=HTTP_LIMITS
+        ) as http_client:
+            results = await asyncio.gather(
+                *(
+                    build_release_notes(
+                        owner,
+                        repo,
+                        start_date,
+                        end_date,
+                        args.editor,
+                        args.cache,
+                        http_client,
+                        args.editor_mode,
+                    )
+                    for owner, repo, start_date, end_date in targets
+                ),
+                return_exceptions=True,
+            )
 
-            # Display editor feedback
+        failed = 0
+        for (owner, repo, _, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                print(f"\nError generating release notes for {owner}/{repo}: {result}")
+                failed += 1
+                continue
+
+            release_notes, editor_review = result
+            final_markdown = release_notes
+            if editor_review is not None:
+                # Display editor feedback
+                print("\n" + "=" * 80)
+                print(f"EDITOR REVIEW COMPLETE: {owner}/{repo}")
+                print("=" * 80)
+
+                if editor_review.changes_made:
+                    print("\nChanges Made:")
+                    for change in editor_review.changes_made:
+                        print(f"  - {change}")
+
+                if editor_review.clarity_issues_fixed:
+                    print("\nClarity Issues Fixed:")
+                    for issue in editor_review.clarity_issues_fixed:
+                        print(f"  - {issue}")
+
+                if editor_review.consistency_improvements:
+                    print("\nConsistency Improvements:")
+                    for improvement in editor_review.consistency_improvements:
+                        print(f"  - {improvement}")
+
+                if editor_review.recommendations:
+                    print("\nRecommendations:")
+                    for rec in editor_review.recommendations:
+                        print(f"  - {rec}")
+
+                final_markdown = editor_review.edited_markdown
+
+            # Prompt for output filename
             print("\n" + "=" * 80)
-            print("EDITOR REVIEW COMPLETE")
-            print("=" * 80)
-
-            if editor_review.changes_made:
-                print("\nChanges Made:")
-                for change in editor_review.changes_made:
-                    print(f"  - {change}")
-
-            if editor_review.clarity_issues_fixed:
-                print("\nClarity Issues Fixed:")
-                for issue in editor_review.clarity_issues_fixed:
-                    print(f"  - {issue}")
-
-            if editor_review.consistency_improvements:
-                print("\nConsistency Improvements:")
-                for improvement in editor_review.consistency_improvements:
-                    print(f"  - {improvement}")
-
-            if editor_review.recommendations:
-                print("\nRecommendations:")
-                for rec in editor_review.recommendations:
-                    print(f"  - {rec}")
-
-            final_markdown = editor_review.edited_markdown
-
-        # Prompt for output filename
-        print("\n" + "=" * 80)
-        output_file = input("Output filename (press Enter for stdout): ").strip()
-
-        if output_file:
-            # Write to file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(final_markdown)
-            print(f"\nRelease notes saved to: {output_file}")
-            print("=" * 80)
-        else:
-            # Output to stdout
-            print("=" * 80)
-            print("FINAL RELEASE NOTES")
-            print("=" * 80 + "\n")
-            print(final_markdown)
+            output_file = input(
+                f"Output filename for {owner}/{repo} (press Enter for stdout): "
+            ).strip()
+
+            if output_file:
+                # Write to file
+                write_output(output_file, final_markdown)
+                print(f"\nRelease notes saved to: {output_file}")
+                print("=" * 80)
+            else:
+                # Output to stdout
+                print("=" * 80)
+                print(f"FINAL RELEASE NOTES: {owner}/{repo}")
+                print("=" * 80 + "\n")
+                print(final_markdown)
 
     except Exception as e:
         print(f"Error generating release notes: {e}")
         sys.exit(1)
 
+    if failed:
+        print(f"\nFailed to generate release notes for {failed} of {len(targets)} repositories")
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     asyncio.run(main())